@@ -2,10 +2,21 @@ import streamlit as st
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+import hashlib
 import json
+import os
 from pathlib import Path
-import re
+import time
+from typing import Optional
+import uuid
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Page config
 st.set_page_config(page_title="Budget Buddy", page_icon="💰", layout="wide")
@@ -44,6 +55,33 @@ DATA_DIR.mkdir(exist_ok=True)
 def get_data_file(month_ym: str) -> Path:
     return DATA_DIR / f"budget_{month_ym}.json"
 
+@st.cache_resource
+def _sweep_stale_temp_files():
+    # A hard crash mid-save can leave temp files behind; clear them once per
+    # process, skipping recent ones that another instance may still be writing
+    cutoff = time.time() - 3600
+    for p in DATA_DIR.glob("budget_*.json.*.tmp"):
+        try:
+            if p.stat().st_mtime < cutoff:
+                p.unlink()
+        except FileNotFoundError:
+            pass
+
+_sweep_stale_temp_files()
+
+def to_json_bytes(data: dict, sort_keys: bool = False) -> bytes:
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(data, option=option)
+    return json.dumps(data, indent=2, sort_keys=sort_keys).encode()
+
+def from_json_bytes(raw: bytes) -> dict:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 def default_month_data() -> dict:
     return {
         "rollover": 0.0,
@@ -65,11 +103,44 @@ def default_month_data() -> dict:
         ],
     }
 
-def load_month_data(month_ym: str) -> dict:
-    fp = get_data_file(month_ym)
-    if fp.exists():
-        with open(fp, "r") as f:
-            d = json.load(f)
+ITEM_COLUMNS = {
+    "income_items": {"name": "object", "amount": "float64"},
+    "bill_items": {"name": "object", "amount": "float64", "paid": "bool"},
+    "expense_items": {"name": "object", "spent": "float64"},
+    "savings_items": {"name": "object", "saved": "float64"},
+}
+
+def normalize_items(key: str, df: pd.DataFrame) -> pd.DataFrame:
+    # Same rules as loading: blank amounts become 0.0 and blank paid flags False,
+    # so an edited frame hashes the same as the file it is saved to
+    dtypes = ITEM_COLUMNS[key]
+    fills = {c: (False if t == "bool" else 0.0) for c, t in dtypes.items() if t != "object"}
+    return df.fillna(fills).astype(dtypes)
+
+def to_item_frames(data: dict) -> dict:
+    # Hold each item list as typed columns so totals are plain column sums
+    out = dict(data)
+    for key, dtypes in ITEM_COLUMNS.items():
+        out[key] = normalize_items(key, pd.DataFrame(data.get(key, []), columns=list(dtypes)))
+    return out
+
+def read_month_file(month_ym: str) -> Optional[bytes]:
+    # Another session may Reset (delete) the month between stat and read
+    try:
+        return get_data_file(month_ym).read_bytes()
+    except FileNotFoundError:
+        return None
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _load_month_data_cached(month_ym: str, mtime_ns: Optional[int], _raw: Optional[bytes] = None) -> tuple[dict, str]:
+    # mtime_ns is only part of the cache key so edits on disk invalidate the entry;
+    # None means the month has no file yet. The hash is cached with the data so
+    # reruns don't re-serialize the month just to check whether it changed.
+    raw = _raw
+    if raw is None and mtime_ns is not None:
+        raw = read_month_file(month_ym)
+    if raw is not None:
+        d = from_json_bytes(raw)
         # Normalize old data
         out = default_month_data()
         out["rollover"] = float(d.get("rollover", 0.0) or 0.0)
@@ -96,44 +167,102 @@ def load_month_data(month_ym: str) -> dict:
         # Savings - just saved
         savings = d.get("savings_items", [])
         out["savings_items"] = [{"name": x.get("name", ""), "saved": float(x.get("saved", 0.0) or 0.0)} for x in savings]
-        
-        return out
-    return default_month_data()
+    else:
+        out = default_month_data()
+    data = to_item_frames(out)
+    return data, data_hash(data)
+
+def month_mtime_ns(month_ym: str) -> Optional[int]:
+    try:
+        return get_data_file(month_ym).stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+def load_month_data_with_hash(month_ym: str) -> tuple[dict, str]:
+    return _load_month_data_cached(month_ym, month_mtime_ns(month_ym))
+
+def column_total(df: pd.DataFrame, column: str) -> float:
+    if column not in df:
+        return 0.0
+    # Item frames are float64 from load/normalize_items, and sum() skips NaN
+    return float(df[column].sum())
+
+def items_records(items) -> list[dict]:
+    # Editors hand back DataFrames; only turn them into records for persistence
+    if isinstance(items, pd.DataFrame):
+        return items.to_dict("records")
+    return items
+
+def serialize_month_data(data: dict) -> dict:
+    return {k: items_records(v) for k, v in data.items()}
 
 def save_month_data(month_ym: str, data: dict):
     fp = get_data_file(month_ym)
-    with open(fp, "w") as f:
-        json.dump(data, f, indent=2)
+    # Write to a per-call temp file and swap it in, so readers and concurrent
+    # sessions only ever see a whole file if the process dies mid-write
+    # (no fsync, so this does not cover power loss). Creating it with open()
+    # keeps the usual umask-based permissions on the saved file.
+    payload = to_json_bytes(serialize_month_data(data))
+    tmp = fp.with_name(f"{fp.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        with open(tmp, "xb") as f:
+            f.write(payload)
+        os.replace(tmp, fp)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+def data_hash(data: dict) -> str:
+    return hashlib.blake2b(to_json_bytes(serialize_month_data(data), sort_keys=True), digest_size=16).hexdigest()
+
+def _scan_saved_months() -> set[str]:
+    months = set()
+    for p in DATA_DIR.glob("budget_*.json"):
+        # Only keep budget_YYYY-MM.json
+        ym = p.stem.removeprefix("budget_")
+        if len(ym) == 7 and ym[4] == "-" and ym[:4].isdigit() and ym[5:].isdigit():
+            months.add(ym)
+    return months
 
 def list_saved_months() -> list[str]:
-    months = []
-    for p in DATA_DIR.glob("budget_*.json"):
-        m = re.findall(r"budget_(\d{4}-\d{2})\.json", p.name)
-        if m:
-            months.append(m[0])
-    return sorted(set(months))
+    # Rescan only when DATA_DIR's mtime moves, i.e. a month file was created,
+    # replaced or deleted by this or any other session
+    mtime_ns = DATA_DIR.stat().st_mtime_ns
+    index = st.session_state.get("_months_index")
+    if index is None or index[0] != mtime_ns:
+        index = (mtime_ns, _scan_saved_months())
+        st.session_state["_months_index"] = index
+    return sorted(index[1])
 
 def aggregate_year(year: int) -> pd.DataFrame:
     months = [m for m in list_saved_months() if m.startswith(f"{year}-")]
-    rows = []
-    for ym in months:
-        d = load_month_data(ym)
-        income = sum(float(x.get("amount", 0.0) or 0.0) for x in d.get("income_items", []))
-        expenses = sum(float(x.get("spent", 0.0) or 0.0) for x in d.get("expense_items", []))
-        bills = sum(float(x.get("amount", 0.0) or 0.0) for x in d.get("bill_items", []))
-        saved = sum(float(x.get("saved", 0.0) or 0.0) for x in d.get("savings_items", []))
-        debt = float(d.get("debt", 0.0) or 0.0)
-        left = income - expenses - bills - saved - debt
-        rows.append({
+    if not months:
+        return pd.DataFrame()
+    
+    # File reads are I/O-bound, so read every existing month concurrently;
+    # parsing and caching stay on this thread
+    mtimes = {ym: month_mtime_ns(ym) for ym in months}
+    existing = [ym for ym in months if mtimes[ym] is not None]
+    raw = {}
+    if len(existing) > 1:
+        with ThreadPoolExecutor(max_workers=min(8, len(existing))) as ex:
+            raw = dict(zip(existing, ex.map(read_month_file, existing)))
+    month_data = [_load_month_data_cached(ym, mtimes[ym], raw.get(ym))[0] for ym in months]
+    
+    rows = [
+        {
             "Month": ym,
-            "Income": income,
-            "Expenses": expenses,
-            "Bills": bills,
-            "Saved": saved,
-            "Debt": debt,
-            "Left": left,
-        })
-    return pd.DataFrame(rows)
+            "Income": column_total(d["income_items"], "amount"),
+            "Expenses": column_total(d["expense_items"], "spent"),
+            "Bills": column_total(d["bill_items"], "amount"),
+            "Saved": column_total(d["savings_items"], "saved"),
+            "Debt": float(d.get("debt", 0.0) or 0.0),
+        }
+        for ym, d in zip(months, month_data)
+    ]
+    year_df = pd.DataFrame.from_records(rows)
+    year_df["Left"] = year_df["Income"] - year_df["Expenses"] - year_df["Bills"] - year_df["Saved"] - year_df["Debt"]
+    return year_df
 
 # Session state
 if "current_month" not in st.session_state:
@@ -165,21 +294,22 @@ with col4:
 
 # Helpful note
 if view_mode == "Month":
-    st.info("💡 **Tip:** Enter your transactions in the sections below, then click **💾 Save** to update the charts above!")
+    st.info("💡 **Tip:** Enter your transactions in the sections below and the charts above update as you go!")
 
 st.divider()
 
-# Load data
-data = load_month_data(st.session_state.current_month)
-
-# Year view setup
-saved_months = list_saved_months()
-current_year = int(st.session_state.current_month.split("-")[0])
-available_years = sorted({int(m.split("-")[0]) for m in saved_months} | {current_year})
+# Load data (only the Month view shows or edits it)
+if view_mode == "Month":
+    data, loaded_hash = load_month_data_with_hash(st.session_state.current_month)
 
+# Year view setup, only computed when the Year view is shown
 year_df = None
 selected_year = None
 if view_mode == "Year":
+    saved_months = list_saved_months()
+    current_year = int(st.session_state.current_month.split("-")[0])
+    available_years = sorted({int(m.split("-")[0]) for m in saved_months} | {current_year})
+    
     y1, y2 = st.columns([1.3, 2.7])
     with y1:
         selected_year = st.selectbox("Year", available_years, index=available_years.index(current_year))
@@ -192,68 +322,99 @@ if view_mode == "Year":
     y_debt = float(year_df["Debt"].sum()) if not year_df.empty else 0.0
     y_left = y_income - y_expenses - y_bills - y_saved - y_debt
 
-# Helper function to calculate totals
-def calculate_totals(data):
-    total_income = sum(float(x.get("amount", 0.0) or 0.0) for x in data.get("income_items", []))
-    total_bills = sum(float(x.get("amount", 0.0) or 0.0) for x in data.get("bill_items", []))
-    total_expenses = sum(float(x.get("spent", 0.0) or 0.0) for x in data.get("expense_items", []))
-    total_savings = sum(float(x.get("saved", 0.0) or 0.0) for x in data.get("savings_items", []))
-    total_debt = float(data.get("debt", 0.0) or 0.0)
-    rollover = float(data.get("rollover", 0.0) or 0.0)
-    left_amount = total_income + rollover - total_expenses - total_bills - total_savings - total_debt
-    return total_income, total_bills, total_expenses, total_savings, total_debt, rollover, left_amount
-
-# VISUAL OVERVIEW
-section_header("📊 VISUAL OVERVIEW", "See where your money goes")
-
-# Recalculate totals to show latest data
-total_income, total_bills, total_expenses, total_savings, total_debt, rollover, left_amount = calculate_totals(data)
-
-if view_mode == "Month":
-    c1, c2 = st.columns(2)
-    
-    with c1:
-        st.markdown("### Spending Breakdown")
-        if total_income > 0 and (total_expenses + total_bills + total_savings) > 0:
-            allocation = pd.DataFrame({
-                "Category": ["Expenses", "Bills", "Savings"],
-                "Amount": [total_expenses, total_bills, total_savings],
-            })
-            allocation = allocation[allocation["Amount"] > 0]
-            fig = px.pie(allocation, values="Amount", names="Category")
-            fig.update_traces(textposition="inside", textinfo="percent+label")
-            st.plotly_chart(fig, use_container_width=True)
-        else:
-            st.info("Add transactions to see spending breakdown")
+# Chart builders, cached so unchanged inputs skip figure construction
+@st.cache_data(show_spinner=False, max_entries=32)
+def build_bar_chart(df: pd.DataFrame, x: str, y: str) -> go.Figure:
+    fig = px.bar(df, x=x, y=y)
+    fig.update_traces(hovertemplate=None)
+    fig.update_layout(hovermode="x")
+    return fig
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def build_month_pies(income: float, expenses: float, bills: float, savings: float, rollover: float, left_amount: float) -> go.Figure:
+    # Spending breakdown and amount left share one figure so the browser sets up a single plot
+    fig = make_subplots(
+        rows=1,
+        cols=2,
+        specs=[[{"type": "domain"}, {"type": "domain"}]],
+        subplot_titles=["Spending Breakdown", "Amount Left"],
+    )
+    fig.update_annotations(font=dict(size=20, color="#1E40AF"))
+    breakdown_x, donut_x = (a.x for a in fig.layout.annotations)
     
-    with c2:
-        st.markdown("### Amount Left")
-        base = max(total_income + rollover, 0.0)
-        remaining = max(left_amount, 0.0)
-        spent = max(base - remaining, 0.0)
-        
-        fig = go.Figure(data=[go.Pie(
-            values=[remaining, spent] if base > 0 else [1],
-            labels=["Remaining", "Spent"] if base > 0 else ["No Data"],
-            hole=0.65,
-        )])
-        fig.update_layout(
-            annotations=[dict(text=f"${left_amount:,.2f}", x=0.5, y=0.5, font_size=26, showarrow=False)],
-            showlegend=False,
-            margin=dict(l=10, r=10, t=10, b=10),
-        )
-        st.plotly_chart(fig, use_container_width=True)
+    allocation = [(c, v) for c, v in [("Expenses", expenses), ("Bills", bills), ("Savings", savings)] if v > 0]
+    if income > 0 and allocation:
+        fig.add_trace(go.Pie(
+            labels=[c for c, _ in allocation],
+            values=[v for _, v in allocation],
+            textposition="inside",
+            textinfo="percent+label",
+        ), 1, 1)
+    else:
+        fig.add_annotation(text="Add transactions to see spending breakdown", x=breakdown_x, y=0.5, showarrow=False)
     
-    if left_amount < 0:
-        st.error(f"⚠️ You spent ${abs(left_amount):,.2f} more than you earned")
+    base = max(income + rollover, 0.0)
+    remaining = max(left_amount, 0.0)
+    spent = max(base - remaining, 0.0)
+    fig.add_trace(go.Pie(
+        values=[remaining, spent] if base > 0 else [1],
+        labels=["Remaining", "Spent"] if base > 0 else ["No Data"],
+        marker=dict(colors=["#3B82F6", "#CBD5E1"] if base > 0 else ["#E2E8F0"]),
+        hole=0.65,
+        showlegend=False,
+    ), 1, 2)
     
-    st.markdown("### Cash Flow")
+    fig.add_annotation(text=f"${left_amount:,.2f}", x=donut_x, y=0.5, font_size=26, showarrow=False)
+    fig.update_layout(margin=dict(l=10, r=10, t=50, b=10))
+    return fig
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def build_cash_flow_chart(income: float, expenses: float, bills: float, savings: float, debt: float) -> go.Figure:
     cf = pd.DataFrame({
         "Category": ["Income", "Expenses", "Bills", "Savings", "Debt"],
-        "Amount": [total_income, total_expenses, total_bills, total_savings, total_debt],
+        "Amount": [income, expenses, bills, savings, debt],
     })
-    fig = px.bar(cf, x="Category", y="Amount")
-    st.plotly_chart(fig, use_container_width=True)
+    return build_bar_chart(cf, "Category", "Amount")
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def build_year_bars(year_df: pd.DataFrame) -> go.Figure:
+    fig = make_subplots(rows=1, cols=2, subplot_titles=["Monthly Expenses", "Monthly Savings"])
+    fig.update_annotations(font=dict(size=20, color="#1E40AF"))
+    fig.add_trace(go.Bar(x=year_df["MonthLabel"], y=year_df["Expenses"], name="Expenses"), 1, 1)
+    fig.add_trace(go.Bar(x=year_df["MonthLabel"], y=year_df["Saved"], name="Saved"), 1, 2)
+    fig.update_yaxes(title_text="Expenses", row=1, col=1)
+    fig.update_yaxes(title_text="Saved", row=1, col=2)
+    fig.update_layout(showlegend=False, hovermode="x")
+    return fig
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def build_export_csv(month_hash: str, _data: dict) -> str:
+    # month_hash stands in for the unhashable data when keying the cache
+    sections = [
+        ("Income", "income_items", "amount"),
+        ("Bills", "bill_items", "amount"),
+        ("Expenses", "expense_items", "spent"),
+        ("Savings", "savings_items", "saved"),
+    ]
+    export_df = pd.concat(
+        [
+            pd.DataFrame({
+                "Category": category,
+                "Item": _data[key]["name"].fillna(""),
+                "Amount": pd.to_numeric(_data[key][column], errors="coerce").fillna(0.0),
+            })
+            for category, key, column in sections
+        ],
+        ignore_index=True,
+    )
+    return export_df.to_csv(index=False)
+
+# VISUAL OVERVIEW
+section_header("📊 VISUAL OVERVIEW", "See where your money goes")
+
+if view_mode == "Month":
+    # Filled in after the editors below so the charts reflect this run's edits
+    visual_overview = st.container()
 
 else:
     st.markdown(f"### Year Summary ({selected_year})")
@@ -265,58 +426,18 @@ else:
     
     if year_df is not None and not year_df.empty:
         year_df = year_df.copy()
-        year_df["MonthLabel"] = year_df["Month"].apply(
-            lambda x: datetime.strptime(x + "-01", "%Y-%m-%d").strftime("%b")
-        )
-        
-        ych1, ych2 = st.columns(2)
-        with ych1:
-            st.markdown("### Monthly Expenses")
-            fig = px.bar(year_df, x="MonthLabel", y="Expenses")
-            st.plotly_chart(fig, use_container_width=True)
+        year_df["MonthLabel"] = pd.to_datetime(year_df["Month"] + "-01", format="%Y-%m-%d").dt.strftime("%b")
         
-        with ych2:
-            st.markdown("### Monthly Savings")
-            fig = px.bar(year_df, x="MonthLabel", y="Saved")
-            st.plotly_chart(fig, use_container_width=True)
+        fig = build_year_bars(year_df)
+        st.plotly_chart(fig, use_container_width=True)
 
 st.divider()
 
 # FINANCIAL OVERVIEW
 section_header("📈 FINANCIAL OVERVIEW", "Summary of your finances")
 
-# Recalculate totals again
-total_income, total_bills, total_expenses, total_savings, total_debt, rollover, left_amount = calculate_totals(data)
-
 if view_mode == "Month":
     ov1, ov2 = st.columns([3, 1])
-    with ov1:
-        overview_df = pd.DataFrame({
-            "Category": [
-                "+ Rollover",
-                "+ Income",
-                "- Expenses",
-                "- Bills",
-                "- Savings",
-                "- Debt",
-                "LEFT",
-            ],
-            "Amount": [
-                rollover,
-                total_income,
-                total_expenses,
-                total_bills,
-                total_savings,
-                total_debt,
-                left_amount,
-            ],
-        })
-        st.dataframe(
-            overview_df.style.format({"Amount": "${:,.2f}"}),
-            use_container_width=True,
-            hide_index=True,
-        )
-    
     with ov2:
         st.markdown("**Adjustments**")
         data["rollover"] = float(st.number_input("Rollover", value=float(data["rollover"]), step=10.0, format="%.2f"))
@@ -328,8 +449,9 @@ else:
             "Category": ["Income", "Expenses", "Bills", "Saved", "Debt", "LEFT"],
             "Amount": [y_income, y_expenses, y_bills, y_saved, y_debt, y_left],
         })
+        year_overview["Amount"] = year_overview["Amount"].map(lambda v: f"${v:,.2f}")
         st.dataframe(
-            year_overview.style.format({"Amount": "${:,.2f}"}),
+            year_overview,
             use_container_width=True,
             hide_index=True,
         )
@@ -340,7 +462,7 @@ if view_mode == "Month":
     # INCOME
     section_header("💵 INCOME", "Track your income sources")
     
-    income_df = pd.DataFrame(data["income_items"])
+    income_df = data["income_items"]
     edited_income = st.data_editor(
         income_df,
         column_config={
@@ -352,15 +474,17 @@ if view_mode == "Month":
         hide_index=True,
         key="income_editor",
     )
-    data["income_items"] = edited_income.to_dict("records")
-    st.markdown(f"### **Total Income: ${sum(float(x.get('amount', 0.0) or 0.0) for x in data['income_items']):,.2f}**")
+    edited_income = normalize_items("income_items", edited_income)
+    data["income_items"] = edited_income
+    total_income = column_total(edited_income, "amount")
+    st.markdown(f"### **Total Income: ${total_income:,.2f}**")
     
     st.divider()
     
     # BILLS
     section_header("📄 BILLS", "Track your bills")
     
-    bill_df = pd.DataFrame(data["bill_items"])
+    bill_df = data["bill_items"]
     edited_bills = st.data_editor(
         bill_df,
         column_config={
@@ -373,17 +497,19 @@ if view_mode == "Month":
         hide_index=True,
         key="bills_editor",
     )
-    data["bill_items"] = edited_bills.to_dict("records")
+    edited_bills = normalize_items("bill_items", edited_bills)
+    data["bill_items"] = edited_bills
     
-    paid_count = sum(1 for x in data["bill_items"] if x.get("paid", False))
-    st.markdown(f"**Total Bills: ${sum(float(x.get('amount', 0.0) or 0.0) for x in data['bill_items']):,.2f}** | ✅ Paid: {paid_count}/{len(data['bill_items'])}")
+    paid_count = int(edited_bills["paid"].sum())
+    total_bills = column_total(edited_bills, "amount")
+    st.markdown(f"**Total Bills: ${total_bills:,.2f}** | ✅ Paid: {paid_count}/{len(edited_bills)}")
     
     st.divider()
     
     # EXPENSES
     section_header("💳 EXPENSES", "Track your spending")
     
-    expense_df = pd.DataFrame(data["expense_items"])
+    expense_df = data["expense_items"]
     edited_expenses = st.data_editor(
         expense_df,
         column_config={
@@ -396,15 +522,17 @@ if view_mode == "Month":
         key="expenses_editor",
     )
     
-    data["expense_items"] = edited_expenses.to_dict("records")
-    st.markdown(f"**Total Expenses: ${sum(float(x.get('spent', 0.0) or 0.0) for x in data['expense_items']):,.2f}**")
+    edited_expenses = normalize_items("expense_items", edited_expenses)
+    data["expense_items"] = edited_expenses
+    total_expenses = column_total(edited_expenses, "spent")
+    st.markdown(f"**Total Expenses: ${total_expenses:,.2f}**")
     
     st.divider()
     
     # SAVINGS
     section_header("🏦 SAVINGS", "Track money saved")
     
-    savings_df = pd.DataFrame(data["savings_items"])
+    savings_df = data["savings_items"]
     edited_savings = st.data_editor(
         savings_df,
         column_config={
@@ -417,11 +545,59 @@ if view_mode == "Month":
         key="savings_editor",
     )
     
-    data["savings_items"] = edited_savings.to_dict("records")
-    st.markdown(f"**Total Saved: ${sum(float(x.get('saved', 0.0) or 0.0) for x in data['savings_items']):,.2f}**")
+    edited_savings = normalize_items("savings_items", edited_savings)
+    data["savings_items"] = edited_savings
+    total_savings = column_total(edited_savings, "saved")
+    st.markdown(f"**Total Saved: ${total_savings:,.2f}**")
     
     st.divider()
     
+    current_hash = data_hash(data)
+    
+    # Section totals come from the footers above, so each column is summed once per run
+    total_debt = float(data.get("debt", 0.0) or 0.0)
+    rollover = float(data.get("rollover", 0.0) or 0.0)
+    left_amount = total_income + rollover - total_expenses - total_bills - total_savings - total_debt
+    
+    with visual_overview:
+        fig = build_month_pies(total_income, total_expenses, total_bills, total_savings, rollover, left_amount)
+        st.plotly_chart(fig, use_container_width=True)
+        
+        if left_amount < 0:
+            st.error(f"⚠️ You spent ${abs(left_amount):,.2f} more than you earned")
+        
+        st.markdown("### Cash Flow")
+        fig = build_cash_flow_chart(total_income, total_expenses, total_bills, total_savings, total_debt)
+        st.plotly_chart(fig, use_container_width=True)
+    
+    with ov1:
+        overview_df = pd.DataFrame({
+            "Category": [
+                "+ Rollover",
+                "+ Income",
+                "- Expenses",
+                "- Bills",
+                "- Savings",
+                "- Debt",
+                "LEFT",
+            ],
+            "Amount": [
+                rollover,
+                total_income,
+                total_expenses,
+                total_bills,
+                total_savings,
+                total_debt,
+                left_amount,
+            ],
+        })
+        overview_df["Amount"] = overview_df["Amount"].map(lambda v: f"${v:,.2f}")
+        st.dataframe(
+            overview_df,
+            use_container_width=True,
+            hide_index=True,
+        )
+    
     # ACTIONS
     section_header("✅ ACTIONS", "Save or export your data")
     
@@ -430,31 +606,17 @@ if view_mode == "Month":
     with a1:
         if st.button("💾 Save", type="primary", use_container_width=True):
             save_month_data(st.session_state.current_month, data)
+            loaded_hash = current_hash
             st.success(f"✅ Saved for {selected_month_dt.strftime('%B %Y')}!")
-            st.rerun()  # Refresh to update charts
     
     with a2:
-        if st.button("📥 Export CSV", use_container_width=True):
-            export_rows = []
-            for item in data.get("income_items", []):
-                export_rows.append({"Category": "Income", "Item": item.get("name", ""), "Amount": float(item.get("amount", 0.0) or 0.0)})
-            for item in data.get("bill_items", []):
-                export_rows.append({"Category": "Bills", "Item": item.get("name", ""), "Amount": float(item.get("amount", 0.0) or 0.0)})
-            for item in data.get("expense_items", []):
-                export_rows.append({"Category": "Expenses", "Item": item.get("name", ""), "Amount": float(item.get("spent", 0.0) or 0.0)})
-            for item in data.get("savings_items", []):
-                export_rows.append({"Category": "Savings", "Item": item.get("name", ""), "Amount": float(item.get("saved", 0.0) or 0.0)})
-            
-            export_df = pd.DataFrame(export_rows)
-            csv = export_df.to_csv(index=False)
-            
-            st.download_button(
-                label="Download CSV",
-                data=csv,
-                file_name=f"expenses_{st.session_state.current_month}.csv",
-                mime="text/csv",
-                use_container_width=True,
-            )
+        st.download_button(
+            label="📥 Export CSV",
+            data=build_export_csv(current_hash, data),
+            file_name=f"expenses_{st.session_state.current_month}.csv",
+            mime="text/csv",
+            use_container_width=True,
+        )
     
     with a3:
         if st.button("🔄 Reset", use_container_width=True):
@@ -464,8 +626,9 @@ if view_mode == "Month":
             st.success("Reset! Reloading...")
             st.rerun()
 
-# Auto-save on any change
-save_month_data(st.session_state.current_month, data)
+# Auto-save on any change (data is only editable in the Month view)
+if view_mode == "Month" and current_hash != loaded_hash:
+    save_month_data(st.session_state.current_month, data)
 
 # Footer
 st.divider()